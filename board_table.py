@@ -0,0 +1,263 @@
+import os
+import sys
+import glob
+import hashlib
+import mmap
+import struct
+import shutil
+import tempfile
+import multiprocessing
+import numpy as np
+from collections import Counter
+from typing import Iterator, Optional
+from corpus_index import CorpusIndex
+from gridle_parser import Gridle
+from gridle_solver import GridleSolution, Row, Column, word_pattern
+from shared_corpus import SharedCorpus
+
+# file layout: the header, the sorted multiset keys of all boards and then the boards in the same order
+# a board is six word indices into the corpus, the rows followed by the columns
+# header: magic, format version, bytes per word index, number of boards, sha256 of the corpus
+MAGIC = b"GRIDLEBT"
+VERSION = 2
+_HEADER = struct.Struct("<8sHHQ32s")
+
+# pseudo random 64 bit values per letter, the key of a letter multiset is the sum of the values of its letters
+# so that the key of a board is the sum of the keys of its words
+# they are hashes of the letters, so that tables stay valid no matter which library versions built them
+_LETTER_KEYS = np.array(
+    [
+        int.from_bytes(hashlib.blake2b(letter.encode(), digest_size=8, person=b"gridle").digest(), "little")
+        for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    ],
+    dtype=np.uint64,
+)
+
+# boards are spread over this many temporary files by the top bits of their key, so that every file can be sorted in memory
+_BUCKET_BITS = 8
+# boards a worker holds in memory before it appends them to the bucket files
+_BATCH_BOARDS = 2**20
+
+
+# returns the key of the letter multiset 'chars'
+def multiset_key(chars: list[str]) -> int:
+    codes = np.frombuffer("".join(chars).encode("ascii"), dtype=np.uint8) - ord("A")
+    return int(_LETTER_KEYS[codes].sum(dtype=np.uint64))
+
+
+# memory mapped table of all boards of a corpus
+class BoardTable:
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, id_bytes, count, digest = _HEADER.unpack_from(self.mmap)
+        if magic != MAGIC:
+            raise Exception(f"{path} is not a board table")
+        if version != VERSION:
+            raise Exception(f"{path} has an unsupported board table format")
+
+        self.digest = digest.hex()
+        id_type = _id_type(id_bytes)
+        self.keys = np.frombuffer(self.mmap, dtype="<u8", count=count, offset=_HEADER.size)
+        self.boards = np.frombuffer(self.mmap, dtype=id_type, count=count * 6, offset=_HEADER.size + count * 8).reshape(count, 6)
+
+    # returns the boards whose letters may be the multiset 'chars', different multisets can share a key
+    def lookup(self, chars: list[str]) -> np.ndarray:
+        key = np.uint64(multiset_key(chars))
+        start = np.searchsorted(self.keys, key, side="left")
+        end = np.searchsorted(self.keys, key, side="right")
+        return self.boards[start:end]
+
+
+# solves 'gridle' by looking up all boards with its letters in 'table' and checking them against the colours
+# if several boards fit, the one with the most frequent words is returned
+def solve_from_table(gridle: Gridle, corpus: list[str], table: BoardTable) -> GridleSolution:
+    index = CorpusIndex.of(corpus)
+    if table.digest != index.digest:
+        raise Exception("Board table was built for another corpus")
+
+    selectors = [Row(gridle, rc) for rc in range(3)] + [Column(gridle, rc) for rc in range(3)]
+    patterns = [word_pattern(gridle, selector) for selector in selectors]
+    chars = Counter(gridle.chars())
+
+    best = None
+    for board in table.lookup(gridle.chars()):
+        words = [corpus[i] for i in board]
+        if not all(pattern.matches(word) for pattern, word in zip(patterns, words)):
+            continue
+        grid = _grid(words)
+        if Counter(char for row in grid for char in row if char is not None) != chars:
+            continue
+        score = float(np.log1p(index.weights[board]).sum())
+        if best is None or score > best[1]:
+            best = (grid, score)
+
+    return GridleSolution(gridle, [[None] * 5] * 5 if best is None else best[0])
+
+
+# enumerates all boards of 'corpus' on 'workers' processes and writes them to a board table at 'path'
+def build_table(corpus: list[str], path: str, workers: Optional[int] = None, chunksize: int = 16):
+    index = CorpusIndex.of(corpus)
+    scratch = tempfile.mkdtemp(prefix="board-table-", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        # every task enumerates the boards of some first rows and spreads them over the bucket files
+        chunks = [(start, min(start + chunksize, len(corpus))) for start in range(0, len(corpus), chunksize)]
+        shared = SharedCorpus.publish(corpus)
+        try:
+            with multiprocessing.Pool(workers, _init_worker, (shared, scratch)) as pool:
+                for _ in pool.imap_unordered(_write_boards, chunks):
+                    pass
+        finally:
+            shared.unlink()
+
+        record = _record_type(len(corpus))
+        count = sum(os.path.getsize(file) for file in glob.glob(os.path.join(scratch, "*"))) // record.itemsize
+        with open(path, "wb") as out:
+            out.write(_HEADER.pack(MAGIC, VERSION, record["words"].base.itemsize, count, bytes.fromhex(index.digest)))
+            out.truncate(_HEADER.size + count * record.itemsize)
+
+            # buckets hold ascending key ranges, so sorting each of them sorts the whole table
+            written = 0
+            for bucket in range(2**_BUCKET_BITS):
+                files = sorted(glob.glob(os.path.join(scratch, f"{bucket:03d}-*")))
+                if not files:
+                    continue
+                records = np.concatenate([np.fromfile(file, dtype=record) for file in files])
+                records = records[np.argsort(records["key"], kind="stable")]
+
+                out.seek(_HEADER.size + written * 8)
+                out.write(np.ascontiguousarray(records["key"]).tobytes())
+                out.seek(_HEADER.size + count * 8 + written * records["words"][0].nbytes)
+                out.write(np.ascontiguousarray(records["words"]).tobytes())
+                written += len(records)
+    finally:
+        shutil.rmtree(scratch)
+
+
+def _id_type(id_bytes: int) -> str:
+    return "<u2" if id_bytes == 2 else "<u4"
+
+
+def _record_type(corpus_size: int) -> np.dtype:
+    return np.dtype([("key", "<u8"), ("words", _id_type(2 if corpus_size <= 2**16 else 4), (6,))])
+
+
+# returns the grid of the board with the given rows and columns
+def _grid(words: list[str]) -> list[list[Optional[str]]]:
+    grid = [[None] * 5 for _ in range(5)]
+    for rc in range(3):
+        for i in range(5):
+            grid[rc * 2][i] = words[rc][i]
+            grid[i][rc * 2] = words[3 + rc][i]
+    return grid
+
+
+_worker = None
+
+
+def _init_worker(corpus: SharedCorpus, scratch: str):
+    global _worker
+    _worker = _BoardEnumerator(corpus.index(), scratch)
+
+
+def _write_boards(chunk: tuple[int, int]):
+    _worker.write(*chunk)
+
+
+# enumerates the boards of a corpus by their first row
+class _BoardEnumerator:
+    def __init__(self, index: CorpusIndex, scratch: str):
+        self.scratch = scratch
+        self.record = _record_type(len(index.corpus))
+        self.codes = index.array.astype(np.intp) - ord("A")
+
+        # word indices are kept in the narrow type of the table, positions into the corpus fit 32 bits
+        ids = self.record["words"].base
+        self.crossings = self.codes[:, 0] * 26**2 + self.codes[:, 2] * 26 + self.codes[:, 4]
+        self.by_crossings = np.argsort(self.crossings, kind="stable").astype(ids)
+        self.crossing_counts = np.bincount(self.crossings, minlength=26**3)
+        self.crossing_starts = (np.cumsum(self.crossing_counts) - self.crossing_counts).astype(np.int32)
+
+        self.by_first = [np.flatnonzero(self.codes[:, 0] == letter).astype(ids) for letter in range(26)]
+
+        # keys of the letters of whole words (rows) and of the letters between the intersections (columns)
+        self.row_keys = _LETTER_KEYS[self.codes].sum(axis=1, dtype=np.uint64)
+        self.col_keys = _LETTER_KEYS[self.codes[:, [1, 3]]].sum(axis=1, dtype=np.uint64)
+
+    # yields all boards with 'first' as their first row as (N, 6) arrays of about _BATCH_BOARDS boards at most
+    def boards(self, first: int) -> Iterator[np.ndarray]:
+        c0, c1, c2 = (self.by_first[self.codes[first, position]] for position in (0, 2, 4))
+
+        # intersections of the second and third row for every combination of columns
+        second = self.codes[c0, 2, None, None] * 26**2 + self.codes[c1, 2][None, :, None] * 26 + self.codes[c2, 2][None, None, :]
+        third = self.codes[c0, 4, None, None] * 26**2 + self.codes[c1, 4][None, :, None] * 26 + self.codes[c2, 4][None, None, :]
+        valid = (self.crossing_counts[second] > 0) & (self.crossing_counts[third] > 0)
+        i0, i1, i2 = np.nonzero(valid)
+        second, third = second[valid], third[valid]
+
+        # every combination of columns stands for all pairs of second and third rows with its intersections
+        second_starts, third_starts = self.crossing_starts[second], self.crossing_starts[third]
+        third_counts = self.crossing_counts[third].astype(np.int32)
+        repeats = self.crossing_counts[second] * third_counts
+        ends = np.cumsum(repeats)
+        columns = c0[i0], c1[i1], c2[i2]
+
+        # the combinations are expanded a batch at a time, a single combination is never split
+        low = 0
+        while low < len(repeats):
+            done = ends[low - 1] if low else 0
+            high = max(int(np.searchsorted(ends, done + _BATCH_BOARDS, side="right")), low + 1)
+            batch_repeats = repeats[low:high]
+            combination = np.repeat(np.arange(low, high, dtype=np.int32), batch_repeats)
+            offset = np.arange(len(combination), dtype=np.int32) - np.repeat(
+                (ends[low:high] - batch_repeats - done).astype(np.int32), batch_repeats
+            )
+            counts = third_counts[combination]
+
+            boards = np.empty((len(combination), 6), dtype=self.by_crossings.dtype)
+            boards[:, 0] = first
+            boards[:, 1] = self.by_crossings[second_starts[combination] + offset // counts]
+            boards[:, 2] = self.by_crossings[third_starts[combination] + offset % counts]
+            for rc, column in enumerate(columns):
+                boards[:, 3 + rc] = column[combination]
+            yield boards
+            low = high
+
+    # writes the boards of the first rows 'start' to 'end' to the bucket files, about _BATCH_BOARDS boards at a time
+    def write(self, start: int, end: int):
+        batches = []
+        size = 0
+        for first in range(start, end):
+            for boards in self.boards(first):
+                batches.append(boards)
+                size += len(boards)
+                if size >= _BATCH_BOARDS:
+                    self.append(start, np.concatenate(batches))
+                    batches, size = [], 0
+        if batches:
+            self.append(start, np.concatenate(batches))
+
+    # appends 'boards' to the bucket files of the task of the first rows from 'start'
+    def append(self, start: int, boards: np.ndarray):
+        records = np.empty(len(boards), dtype=self.record)
+        records["words"] = boards
+        records["key"] = self.row_keys[boards[:, :3]].sum(axis=1, dtype=np.uint64) + self.col_keys[boards[:, 3:]].sum(
+            axis=1, dtype=np.uint64
+        )
+
+        buckets = records["key"] >> np.uint64(64 - _BUCKET_BITS)
+        order = np.argsort(buckets, kind="stable")
+        records, buckets = records[order], buckets[order]
+        bounds = np.searchsorted(buckets, np.arange(2**_BUCKET_BITS + 1, dtype=np.uint64))
+        for bucket in range(2**_BUCKET_BITS):
+            if bounds[bucket] < bounds[bucket + 1]:
+                with open(os.path.join(self.scratch, f"{bucket:03d}-{start}"), "ab") as file:
+                    records[bounds[bucket] : bounds[bucket + 1]].tofile(file)
+
+
+# builds the board table of a registered corpus: python3 board_table.py en boards.bin [workers]
+if __name__ == "__main__":
+    import corpora
+
+    build_table(corpora.get(sys.argv[1]), sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else None)
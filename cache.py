@@ -0,0 +1,96 @@
+import os
+import time
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+# returns the directory in which persistent caches are stored
+def cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gridle-solver")
+
+
+# in-memory cache that evicts the least recently used entry once it holds 'maxsize' entries
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    # removes 'key' and returns its value if it was cached
+    def pop(self, key: Hashable) -> Optional[Any]:
+        return self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# persistent cache in an SQLite file that evicts the least recently used entries once it holds 'max_entries' entries
+# they are evicted in batches of about 1/64 of 'max_entries', so the file holds somewhat fewer entries right after that
+class DiskCache:
+    def __init__(self, path: str, max_entries: int):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.max_entries = max_entries
+        self.db = sqlite3.connect(path, isolation_level=None)
+        # every lookup writes its access time, so avoid syncing the file on each of them
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, used INTEGER NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+
+        # number of entries, counted once and then kept up to date by 'put'
+        (self.size,) = self.db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        self.batch = max(1, max_entries // 64)
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self.db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.db.execute("UPDATE entries SET used = ? WHERE key = ?", (time.time_ns(), key))
+        return row[0]
+
+    def put(self, key: str, value: bytes):
+        used = time.time_ns()
+        if not self.db.execute("INSERT OR IGNORE INTO entries VALUES (?, ?, ?)", (key, value, used)).rowcount:
+            self.db.execute("UPDATE entries SET value = ?, used = ? WHERE key = ?", (value, used, key))
+            return
+
+        self.size += 1
+        if self.size > self.max_entries:
+            # other processes using the same file may have added or evicted entries as well
+            (self.size,) = self.db.execute("SELECT COUNT(*) FROM entries").fetchone()
+            if self.size > self.max_entries:
+                evicted = self.size - max(self.max_entries - self.batch, 0)
+                self.db.execute("DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY used LIMIT ?)", (evicted,))
+                self.size -= evicted
+
+    def clear(self):
+        self.db.execute("DELETE FROM entries")
+        self.size = 0
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,85 @@
+import sys
+import mmap
+import struct
+import hashlib
+import numpy as np
+from collections.abc import Sequence
+from typing import Iterable, Self
+from corpus_index import WORD_LENGTH
+
+# file layout: the header followed by one record of WORD_LENGTH ascii characters per word
+# header: magic, format version, word length, number of words, sha256 of all records
+MAGIC = b"GRIDLEWC"
+VERSION = 1
+_HEADER = struct.Struct("<8sHHI32s")
+
+
+# words of a corpus file, read straight from the memory mapped file
+class PackedCorpus(Sequence):
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.mmap) < _HEADER.size:
+            raise Exception(f"{path} is not a corpus file")
+        magic, version, length, count, digest = _HEADER.unpack_from(self.mmap)
+        if magic != MAGIC:
+            raise Exception(f"{path} is not a corpus file")
+        if version != VERSION or length != WORD_LENGTH:
+            raise Exception(f"{path} has an unsupported corpus format")
+        if len(self.mmap) != _HEADER.size + count * WORD_LENGTH:
+            raise Exception(f"{path} is truncated")
+
+        self.count = count
+        self.digest = digest.hex()
+
+        # (N, WORD_LENGTH) array of ascii codes that shares the memory of the file
+        self.array = np.frombuffer(self.mmap, dtype=np.uint8, count=count * WORD_LENGTH, offset=_HEADER.size)
+        self.array = self.array.reshape(count, WORD_LENGTH)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("corpus index out of range")
+        start = _HEADER.size + i * WORD_LENGTH
+        return self.mmap[start : start + WORD_LENGTH].decode("ascii")
+
+    # checks that the records match the hash in the header
+    def verify(self) -> Self:
+        if hashlib.sha256(self.array).hexdigest() != self.digest:
+            raise Exception("Corpus file is corrupted")
+        return self
+
+
+# loads the corpus file at 'path' without reading the words into memory
+def load_corpus(path: str, verify: bool = False) -> PackedCorpus:
+    corpus = PackedCorpus(path)
+    return corpus.verify() if verify else corpus
+
+
+# writes 'words' to a corpus file at 'path', every word has to consist of WORD_LENGTH letters A-Z
+def write_corpus(path: str, words: Iterable[str]):
+    records = bytearray()
+    for word in words:
+        if len(word) != WORD_LENGTH or not all("A" <= char <= "Z" for char in word):
+            raise Exception(f"'{word}' is not a word of {WORD_LENGTH} letters A-Z")
+        records += word.encode("ascii")
+
+    count = len(records) // WORD_LENGTH
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, WORD_LENGTH, count, hashlib.sha256(records).digest()))
+        file.write(records)
+
+
+# packs a word list with one word per line: python3 corpus_file.py words.txt corpus.bin
+# the words are normalized like word lists loaded by corpora, duplicates are packed once
+if __name__ == "__main__":
+    from corpora import read_words
+
+    write_corpus(sys.argv[2], dict.fromkeys(word for word, _ in read_words(sys.argv[1])))
@@ -0,0 +1,394 @@
+import os
+import pickle
+import hashlib
+import threading
+import numpy as np
+from cache import LRUCache, cache_dir
+from functools import cached_property
+from typing import Iterable, Iterator, NamedTuple, Optional, Self, Sequence
+
+WORD_LENGTH = 5
+
+# version of the snapshot format, snapshots of other versions are rebuilt
+SNAPSHOT_VERSION = 3
+# the derived parts of an index that solving reads and that are stored in snapshots
+# the trie is left out, it is only built when the trie backend is selected
+_SNAPSHOT_PARTS = ("bitsets", "counts", "anagrams")
+# number of patterns whose matches are kept by each index
+MATCH_CACHE_SIZE = 4096
+# number of corpora whose indexes are kept by CorpusIndex.of, the least recently used one is dropped first
+MAX_INDEXES = 8
+
+
+class WordPattern(NamedTuple):
+    # letters allowed at each position of the word
+    allowed: tuple[frozenset[str], ...]
+    # letters that have to occur at least once at one of the free positions
+    required: frozenset[str]
+    # positions that are not fixed by a green cell
+    free: tuple[int, ...]
+
+    # returns whether 'word' matches this pattern
+    def matches(self, word: str) -> bool:
+        if not all(letter in letters for letter, letters in zip(word, self.allowed)):
+            return False
+        return self.required <= {word[position] for position in self.free}
+
+
+# a list of words with a frequency weight for each of them
+class WeightedWords(list):
+    def __init__(self, words: Iterable[str], weights: Iterable[float]):
+        list.__init__(self, words)
+        self.weights = np.fromiter(weights, dtype=np.float64, count=len(self))
+
+
+# the distinct letter multisets of a corpus as a prefix tree over their sorted letters, stored as flat arrays
+class Anagrams(NamedTuple):
+    # children[node, letter] is the child of 'node' for 'letter' or -1, node 0 is the root
+    # the children of the nodes at depth WORD_LENGTH - 1 are the numbers of the multisets instead
+    children: np.ndarray
+    # indices of the words ordered by multiset, multiset m consists of the words order[starts[m] : starts[m + 1]]
+    order: np.ndarray
+    starts: np.ndarray
+
+    # builds the tree of the (N, 5) array of ascii codes 'array'
+    def of(array: np.ndarray) -> Self:
+        # the sorted letters of each word as a number, so that multisets with a common prefix form a range
+        keys = np.zeros(len(array), dtype=np.int64)
+        for codes in np.sort(array, axis=1).T:
+            keys = keys * 26 + (codes - ord("A"))
+        order = np.argsort(keys, kind="stable")
+        multisets, starts = np.unique(keys[order], return_index=True)
+
+        # the prefixes of every length are the nodes of one level of the tree
+        levels = [np.zeros(1, dtype=np.int64)] + [np.unique(multisets // 26 ** (WORD_LENGTH - depth)) for depth in range(1, WORD_LENGTH)]
+        offsets = np.cumsum([0] + [len(level) for level in levels])
+        children = np.full((offsets[-1], 26), -1, dtype=np.int32)
+        for depth in range(1, WORD_LENGTH + 1):
+            nodes = levels[depth] if depth < WORD_LENGTH else multisets
+            numbers = np.arange(len(nodes)) + (offsets[depth] if depth < WORD_LENGTH else 0)
+            parents = offsets[depth - 1] + np.searchsorted(levels[depth - 1], nodes // 26)
+            children[parents, nodes % 26] = numbers
+
+        return Anagrams(children, order.astype(np.int32), np.append(starts, len(order)).astype(np.int32))
+
+    # returns the indices of the words of the multisets with the numbers 'multisets'
+    def words(self, multisets: np.ndarray) -> np.ndarray:
+        starts = self.starts[multisets]
+        sizes = self.starts[multisets + 1] - starts
+        return self.order[np.repeat(starts - np.cumsum(sizes) + sizes, sizes) + np.arange(sizes.sum())]
+
+
+class CorpusIndex:
+    _instances = LRUCache(MAX_INDEXES)
+    # corpus watchers swap corpora from their own threads
+    _instances_lock = threading.Lock()
+
+    def __init__(self, corpus: Sequence[str]):
+        self.corpus = corpus
+        self.all = (1 << len(corpus)) - 1
+
+    # bitsets[position][letter] has bit i set iff corpus[i] has 'letter' at 'position'
+    # shared corpora carry them packed as (5, 26, N/8) bytes, they are only converted once a bitset match needs them
+    @cached_property
+    def bitsets(self) -> list[dict[str, int]]:
+        packed = getattr(self.corpus, "packed_bitsets", None)
+        if packed is not None:
+            return [
+                {chr(ord("A") + letter): int.from_bytes(bits.tobytes(), "little") for letter, bits in enumerate(column) if bits.any()}
+                for column in packed
+            ]
+        return [{chr(code): _to_bitset(column == code) for code in np.unique(column)} for column in self.columns]
+
+    # returns the (cached) index of 'corpus', building it on first use
+    def of(corpus: Sequence[str]) -> Self:
+        with CorpusIndex._instances_lock:
+            index = CorpusIndex._instances.get(id(corpus))
+            if index is None or index.corpus is not corpus:
+                index = CorpusIndex(corpus)
+                CorpusIndex._instances.put(id(corpus), index)
+        return index
+
+    # drops the cached index of 'corpus', so that the corpus and the caches of its index can be freed
+    def forget(corpus: Sequence[str]):
+        with CorpusIndex._instances_lock:
+            index = CorpusIndex._instances.get(id(corpus))
+            if index is not None and index.corpus is corpus:
+                CorpusIndex._instances.pop(id(corpus))
+
+    # returns the index of 'corpus' with all derived parts loaded from its snapshot in 'directory'
+    # if there is no usable snapshot yet, the parts are built and the snapshot is written
+    # if it cannot be written, the index is only kept in memory
+    def warm(corpus: Sequence[str], directory: Optional[str] = None) -> Self:
+        index = CorpusIndex.of(corpus)
+        path = os.path.join(directory or cache_dir(), f"index-{index.digest}.pickle")
+        if not index.load_snapshot(path):
+            try:
+                index.save_snapshot(path)
+            except OSError:
+                pass
+        return index
+
+    # loads the derived parts from the snapshot at 'path', returns whether it was written for this corpus
+    def load_snapshot(self, path: str) -> bool:
+        try:
+            with open(path, "rb") as file:
+                snapshot = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False
+        if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("digest") != self.digest:
+            return False
+        self.__dict__.update(snapshot["parts"])
+        return True
+
+    # builds all derived parts and writes them to a snapshot at 'path'
+    # the snapshot is written to a temporary file first, so that readers never see a partial one
+    def save_snapshot(self, path: str):
+        parts = {name: getattr(self, name) for name in _SNAPSHOT_PARTS}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary = f"{path}.{os.getpid()}"
+        try:
+            with open(temporary, "wb") as file:
+                pickle.dump({"version": SNAPSHOT_VERSION, "digest": self.digest, "parts": parts}, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    # hash of the words of the corpus in order and of their weights if it has any, corpus files store it in their header
+    @cached_property
+    def digest(self) -> str:
+        digest = getattr(self.corpus, "digest", None)
+        if digest:
+            return digest
+        digest = hashlib.sha256(self.array)
+        if self.weighted:
+            digest.update(np.ascontiguousarray(self.weights, dtype="<f8"))
+        return digest.hexdigest()
+
+    # builds the lazily computed parts of the index that solving reads and its digest
+    def prepare(self) -> Self:
+        for name in (*_SNAPSHOT_PARTS, "digest"):
+            getattr(self, name)
+        return self
+
+    # returns a bitset of all words that have one of 'letters' at 'position'
+    def with_letters(self, position: int, letters: frozenset[str]) -> int:
+        column = self.bitsets[position]
+        bits = 0
+        for letter in letters:
+            bits |= column.get(letter, 0)
+        return bits
+
+    # returns a bitset of all words that have 'letter' at any of 'positions'
+    def with_letter_anywhere(self, positions: tuple[int, ...], letter: str) -> int:
+        bits = 0
+        for position in positions:
+            bits |= self.bitsets[position].get(letter, 0)
+        return bits
+
+    # returns a bitset of all words matching 'pattern'
+    def match_bits(self, pattern: WordPattern) -> int:
+        matches = self.all
+        for position, letters in enumerate(pattern.allowed):
+            matches &= self.with_letters(position, letters)
+            if not matches:
+                return 0
+
+        # every required letter has to be at one of the free positions
+        for letter in pattern.required:
+            matches &= self.with_letter_anywhere(pattern.free, letter)
+            if not matches:
+                return 0
+
+        return matches
+
+    # the corpus as an (N, 5) array of ascii codes, taken without copying from corpus files
+    @cached_property
+    def array(self) -> np.ndarray:
+        array = getattr(self.corpus, "array", None)
+        if array is None:
+            array = np.frombuffer("".join(self.corpus).encode("ascii"), dtype=np.uint8).reshape(-1, WORD_LENGTH)
+        return array
+
+    # the same array stored position by position, so that each position is a contiguous (N,) row
+    @cached_property
+    def columns(self) -> np.ndarray:
+        return np.ascontiguousarray(self.array.T)
+
+    # the number of times each letter A-Z occurs in each word as an (N, 26) array, taken from shared corpora
+    @cached_property
+    def counts(self) -> np.ndarray:
+        counts = getattr(self.corpus, "counts", None)
+        if counts is not None:
+            return counts
+        counts = np.zeros((len(self.corpus), 26), dtype=np.uint8)
+        for position in range(WORD_LENGTH):
+            counts[np.arange(len(self.corpus)), self.columns[position] - ord("A")] += 1
+        return counts
+
+    # returns the indices of all words matching 'pattern', evaluated for the whole corpus at once
+    def match_array(self, pattern: WordPattern) -> np.ndarray:
+        table = np.zeros((WORD_LENGTH, 256), dtype=bool)
+        for position, letters in enumerate(pattern.allowed):
+            table[position, _codes(letters)] = True
+
+        matches = table[0].take(self.columns[0])
+        for position in range(1, WORD_LENGTH):
+            matches &= table[position].take(self.columns[position])
+        ids = np.flatnonzero(matches)
+
+        if pattern.required and ids.size:
+            # every required letter has to be at one of the free positions
+            free = self.array[ids][:, pattern.free]
+            found = free[:, :, np.newaxis] == _codes(pattern.required)[np.newaxis, np.newaxis, :]
+            ids = ids[found.any(axis=1).all(axis=1)]
+
+        return ids
+
+    # prefix tree of the words as nested dicts from ascii codes to subtrees, the last level maps to lists of word indices
+    @cached_property
+    def trie(self) -> dict:
+        root = {}
+        for i, codes in enumerate(self.array.tolist()):
+            node = root
+            for code in codes[:-1]:
+                node = node.setdefault(code, {})
+            node.setdefault(codes[-1], []).append(i)
+        return root
+
+    # the letter multisets of the words as a prefix tree over their sorted letters, taken from shared corpora
+    @cached_property
+    def anagrams(self) -> Anagrams:
+        anagrams = getattr(self.corpus, "anagrams", None)
+        if anagrams is not None:
+            return anagrams
+        return Anagrams.of(self.array)
+
+    # the children of the nodes of 'anagrams' as lists, which are faster to walk than the array
+    @cached_property
+    def anagram_children(self) -> list[list[int]]:
+        return self.anagrams.children.tolist()
+
+    # returns the indices of all words that can be formed from the letter counts 'bag' in ascending order
+    # only the multisets that are contained in 'bag' are visited, the letters of a multiset are taken in ascending order
+    def formable_ids(self, bag: np.ndarray) -> np.ndarray:
+        children = self.anagram_children
+        letters = np.flatnonzero(bag).tolist()
+        available = [int(bag[letter]) for letter in letters]
+        multisets = []
+
+        def walk(node: list[int], depth: int, start: int):
+            for k in range(start, len(letters)):
+                child = node[letters[k]]
+                if child < 0 or not available[k]:
+                    continue
+                if depth == WORD_LENGTH - 1:
+                    multisets.append(child)
+                    continue
+                available[k] -= 1
+                walk(children[child], depth + 1, k)
+                available[k] += 1
+
+        walk(children[0], 0, 0)
+        return np.sort(self.anagrams.words(np.array(multisets, dtype=np.intp)))
+
+    # whether the corpus has word frequencies
+    @cached_property
+    def weighted(self) -> bool:
+        return getattr(self.corpus, "weights", None) is not None
+
+    # the frequency weight of each word, all words weigh the same if the corpus has no frequencies
+    @cached_property
+    def weights(self) -> np.ndarray:
+        return self.corpus.weights if self.weighted else np.ones(len(self.corpus))
+
+    # returns the indices of all words matching 'pattern' that can be formed from the letter counts 'bag'
+    # subtrees are skipped as soon as their prefix does not match, needs more letters than 'bag' has
+    # or leaves too few free positions for the required letters
+    def match_trie(self, pattern: WordPattern, bag: Optional[np.ndarray] = None) -> np.ndarray:
+        allowed = [{ord(letter) for letter in letters} for letters in pattern.allowed]
+        free = [position in pattern.free for position in range(WORD_LENGTH)]
+        free_after = [sum(free[position:]) for position in range(WORD_LENGTH + 1)]
+        available = None if bag is None else {ord("A") + i: int(count) for i, count in enumerate(bag)}
+        ids = []
+
+        def walk(node, position: int, missing: frozenset[int]):
+            if len(missing) > free_after[position]:
+                return
+            if position == WORD_LENGTH:
+                ids.extend(node)
+                return
+            for code in allowed[position] & node.keys():
+                if available is not None:
+                    if not available.get(code):
+                        continue
+                    available[code] -= 1
+                walk(node[code], position + 1, missing - {code} if free[position] else missing)
+                if available is not None:
+                    available[code] += 1
+
+        walk(self.trie, 0, frozenset(map(ord, pattern.required)))
+        return np.sort(np.array(ids, dtype=np.intp))
+
+    # returns the indices of all words matching 'pattern' in ascending order
+    # 'backend' selects how the corpus is searched: "bitset", "numpy" or "trie"
+    # if 'bag' is given, only words that can be formed from these letter counts are returned
+    def match_ids(self, pattern: WordPattern, backend: str = "bitset", bag: Optional[np.ndarray] = None) -> np.ndarray:
+        match backend:
+            case "bitset":
+                ids = np.fromiter(members(self.match_bits(pattern)), dtype=np.intp)
+            case "numpy":
+                ids = self.match_array(pattern)
+            case "trie":
+                return self.match_trie(pattern, bag)
+            case _:
+                raise Exception(f"Unknown backend '{backend}'")
+
+        if bag is not None:
+            ids = ids[(self.counts[ids] <= bag).all(axis=1)]
+        return ids
+
+    # returns all words matching 'pattern' in corpus order
+    def match(self, pattern: WordPattern, backend: str = "bitset", bag: Optional[np.ndarray] = None) -> list[str]:
+        return [self.corpus[i] for i in self.match_ids(pattern, backend, bag)]
+
+    # the indices of the words matching recently used patterns, the rows and columns of different boards often have the same pattern
+    @cached_property
+    def matches(self) -> LRUCache:
+        return LRUCache(MATCH_CACHE_SIZE)
+
+    # returns the indices of all words matching 'pattern' like 'match_ids', looking them up in 'matches' first
+    # the returned array is shared with the cache and must not be modified
+    def match_ids_cached(self, pattern: WordPattern, backend: str = "bitset") -> np.ndarray:
+        ids = self.matches.get(pattern)
+        if ids is None:
+            ids = self.match_ids(pattern, backend)
+            ids.flags.writeable = False
+            self.matches.put(pattern, ids)
+        return ids
+
+    # returns all words matching 'pattern' like 'match', looking them up in 'matches' first
+    def match_cached(self, pattern: WordPattern, backend: str = "bitset") -> list[str]:
+        return [self.corpus[i] for i in self.match_ids_cached(pattern, backend)]
+
+
+# yields the indices of all set bits in ascending order
+def members(bits: int) -> Iterator[int]:
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+# returns the number of times each letter A-Z occurs in 'chars'
+def letter_counts(chars: Iterable[str]) -> np.ndarray:
+    return np.bincount(_codes("".join(chars)) - ord("A"), minlength=26)
+
+
+def _codes(letters: Iterable[str]) -> np.ndarray:
+    return np.frombuffer("".join(letters).encode("ascii"), dtype=np.uint8)
+
+
+def _to_bitset(flags: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
@@ -0,0 +1,60 @@
+import os
+import hashlib
+import numpy as np
+from functools import cache
+from typing import Optional
+from cache import DiskCache, LRUCache, cache_dir
+
+# changes whenever the binarization of the cells changes, so that old entries are not found anymore
+VERSION = 1
+
+
+# returns a hash of the binarized cell 'binary'
+def glyph_key(binary: np.ndarray) -> str:
+    digest = hashlib.blake2b(f"{VERSION}:{binary.shape}".encode(), digest_size=16)
+    digest.update(np.packbits(binary > 0).tobytes())
+    return digest.hexdigest()
+
+
+# caches the characters read from binarized cells in memory and in an SQLite file in 'directory'
+# the game renders every letter the same way each time, so once a glyph was read it never has to be read again
+class GlyphCache:
+    def __init__(self, directory: Optional[str] = None, memory_entries: int = 1024, disk_entries: int = 100_000):
+        self.memory = LRUCache(memory_entries)
+        self.disk = DiskCache(os.path.join(directory or cache_dir(), "glyphs.sqlite"), disk_entries)
+        self.hits = 0
+        self.misses = 0
+
+    # returns the character of 'binary' if it was read before
+    def get(self, binary: np.ndarray) -> Optional[str]:
+        key = glyph_key(binary)
+        char = self.memory.get(key)
+        if char is None:
+            stored = self.disk.get(key)
+            if stored is not None:
+                char = stored.decode()
+                self.memory.put(key, char)
+
+        if char is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return char
+
+    def put(self, binary: np.ndarray, char: str):
+        key = glyph_key(binary)
+        self.memory.put(key, char)
+        self.disk.put(key, char.encode())
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self):
+        self.disk.close()
+
+
+# returns the glyph cache in the default cache directory, it is opened on first use
+@cache
+def glyph_cache() -> GlyphCache:
+    return GlyphCache()
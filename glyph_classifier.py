@@ -0,0 +1,152 @@
+import os
+import sys
+import numpy as np
+from functools import cache
+from typing import Optional, Self
+
+# glyphs are scaled to GLYPH_SIZE x GLYPH_SIZE pixels before they are compared
+GLYPH_SIZE = 16
+# smallest difference between the best and the second best letter, as a fraction of the glyph pixels,
+# for which a classification is trusted
+MIN_MARGIN = 0.04
+# largest distance to the best template, as a fraction of the glyph pixels, for which a classification is trusted
+MAX_DISTANCE = 0.16
+
+# pairs of letters whose glyphs are close enough to be mistaken for each other
+# a letter is only trusted if all letters it can be mistaken for have templates, a glyph of a letter
+# without templates would otherwise be read as its closest known neighbour
+_SIMILAR = (
+    "AR AV BD BE BH BI BP BR BS CG CO DO DU EF EI EL EP FP GO GQ HK HM HN HU IJ IL IN IT JU KR KX MN MW OQ OU PR SZ TY UV VW VY XY XZ"
+)
+NEIGHBOURS: dict[str, frozenset[str]] = {
+    letter: frozenset(pair.replace(letter, "") for pair in _SIMILAR.split() if letter in pair) for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+}
+
+TEMPLATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "glyph_templates.npz")
+
+
+# binary glyph templates of the game font, a small set for each height of the binarized cells they were captured from
+class GlyphTemplates:
+    def __init__(self):
+        # height of the binarized cells -> (letters (K,), glyphs (K, GLYPH_SIZE**2)) sorted by letter
+        self.sets: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    def load(path: str) -> Self:
+        templates = GlyphTemplates()
+        with np.load(path) as data:
+            for name in data.files:
+                if name.startswith("letters_"):
+                    height = int(name.removeprefix("letters_"))
+                    templates.sets[height] = (data[name], data[f"glyphs_{height}"])
+        return templates
+
+    def save(self, path: str):
+        arrays = {}
+        for height, (letters, glyphs) in self.sets.items():
+            arrays[f"letters_{height}"] = letters
+            arrays[f"glyphs_{height}"] = glyphs
+        np.savez_compressed(path, **arrays)
+
+    # adds the glyphs of the binarized cells 'binaries' of 'letters', glyphs that are already known are skipped
+    def add(self, letters: str, binaries: np.ndarray):
+        glyphs, present = normalize(binaries)
+        known, templates = self.sets.get(binaries.shape[1], (np.empty(0, dtype="<U1"), np.empty((0, GLYPH_SIZE**2), dtype=bool)))
+        for letter, glyph in zip(np.array(list(letters))[present], glyphs[present]):
+            if not ((templates == glyph).all(axis=1) & (known == letter)).any():
+                known, templates = np.append(known, letter), np.vstack([templates, glyph])
+        order = np.argsort(known, kind="stable")
+        self.sets[binaries.shape[1]] = (known[order], templates[order])
+
+    # returns the letter of each binarized cell with its margin over the next best letter
+    # the letter is None if there are no templates, the cell has no glyph, it is farther than MAX_DISTANCE from all templates
+    # or the letters its best match can be mistaken for have no templates
+    def classify(self, binaries: np.ndarray) -> list[tuple[Optional[str], float]]:
+        results = [(None, 0.0)] * len(binaries)
+        if not self.sets:
+            return results
+
+        # the templates captured from cells of the closest height
+        height = min(self.sets, key=lambda h: abs(h - binaries.shape[1]))
+        letters, templates = self.sets[height]
+        templates = templates.astype(np.float32)
+        glyphs, present = normalize(binaries)
+        glyphs = glyphs.astype(np.float32)
+
+        # hamming distances of all glyphs to all templates at once
+        distances = glyphs @ (1 - templates).T + (1 - glyphs) @ templates.T
+
+        # the distance of each letter is the one of its closest template, the templates are sorted by letter
+        distinct, starts = np.unique(letters, return_index=True)
+        by_letter = np.minimum.reduceat(distances, starts, axis=1)
+        ranked = np.argsort(by_letter, axis=1)
+        rows = np.arange(len(binaries))
+        best = by_letter[rows, ranked[:, 0]]
+        second = by_letter[rows, ranked[:, 1]] if len(distinct) > 1 else np.full(len(binaries), GLYPH_SIZE**2)
+
+        known = set(distinct.tolist())
+        for i in np.flatnonzero(present):
+            letter = str(distinct[ranked[i, 0]])
+            if best[i] <= MAX_DISTANCE * GLYPH_SIZE**2 and NEIGHBOURS[letter] <= known:
+                results[i] = (letter, float(second[i] - best[i]) / GLYPH_SIZE**2)
+        return results
+
+
+# returns the templates shipped in TEMPLATES_PATH, or no templates if it does not exist
+@cache
+def templates() -> GlyphTemplates:
+    if not os.path.exists(TEMPLATES_PATH):
+        return GlyphTemplates()
+    return GlyphTemplates.load(TEMPLATES_PATH)
+
+
+# returns the glyphs of binarized cells (white on black) of the same size given as an (N, height, width) array
+# each glyph is cut to its bounding box and scaled to GLYPH_SIZE x GLYPH_SIZE, the result is an (N, GLYPH_SIZE**2) array
+# and whether each cell has a glyph at all
+def normalize(binaries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    masks = binaries > 0
+
+    # rows and columns at the border that are mostly white belong to the frame of the cells
+    # one more pixel is skipped for what is left of rounded corners
+    top, bottom = _frame(2 * masks.sum(axis=(0, 2)) > masks.shape[0] * masks.shape[2])
+    left, right = _frame(2 * masks.sum(axis=(0, 1)) > masks.shape[0] * masks.shape[1])
+    masks = masks[:, top + 1 : bottom - 1, left + 1 : right - 1]
+    if not masks.size:
+        return np.zeros((len(binaries), GLYPH_SIZE**2), dtype=bool), np.zeros(len(binaries), dtype=bool)
+
+    rows, cols = masks.any(axis=2), masks.any(axis=1)
+    present = rows.any(axis=1)
+    first_row, end_row = rows.argmax(axis=1), rows.shape[1] - rows[:, ::-1].argmax(axis=1)
+    first_col, end_col = cols.argmax(axis=1), cols.shape[1] - cols[:, ::-1].argmax(axis=1)
+
+    # nearest neighbour sampling of the bounding boxes of all cells at once
+    steps = (np.arange(GLYPH_SIZE) + 0.5) / GLYPH_SIZE
+    ys = first_row[:, np.newaxis] + (steps * (end_row - first_row)[:, np.newaxis]).astype(np.intp)
+    xs = first_col[:, np.newaxis] + (steps * (end_col - first_col)[:, np.newaxis]).astype(np.intp)
+    glyphs = masks[np.arange(len(masks))[:, np.newaxis, np.newaxis], ys[:, :, np.newaxis], xs[:, np.newaxis, :]]
+    return glyphs.reshape(len(masks), -1), present
+
+
+# returns the number of leading flags that are set and the index after the last unset one
+def _frame(flags: np.ndarray) -> tuple[int, int]:
+    unset = np.flatnonzero(~flags)
+    if not unset.size:
+        return 0, 0
+    return unset[0], unset[-1] + 1
+
+
+# adds the glyphs of a screenshot to the shipped templates: python3 glyph_classifier.py screenshot.png [LETTERS]
+# LETTERS are the 21 letters of the cells row by row, they are read with tesseract if they are not given
+if __name__ == "__main__":
+    from PIL import Image
+    from gridle_parser import Gridle, _GridleImage, _glyph_binaries
+
+    image = Image.open(sys.argv[1]).convert("RGB")
+    letters = sys.argv[2] if len(sys.argv) > 2 else "".join(Gridle.parse(image).chars())
+    img = _GridleImage(image)
+    boxes = img.find_cells()
+    if len(letters) != len(boxes):
+        raise Exception(f"Expected {len(boxes)} letters")
+
+    captured = templates()
+    captured.add(letters.upper(), _glyph_binaries([img.crop(start, end) for start, end in boxes]))
+    captured.save(TEMPLATES_PATH)
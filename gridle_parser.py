@@ -1,5 +1,8 @@
 import pytesseract
 import numpy as np
+import glyph_classifier
+from glyph_cache import glyph_cache
+from layout_cache import layout_cache
 from PIL import Image
 from enum import auto, Enum
 from typing import Optional, Self
@@ -31,6 +34,11 @@ class GameColours:
     BACKGROUND = (48, 48, 48)
 
 
+_TESSERACT_LETTERS = "-c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# approximate height of the cells when they are matched against the glyph templates
+_GLYPH_HEIGHT = 48
+
+
 class Cell:
     def __init__(self, start: tuple[int, int], end: tuple[int, int], char: str, colour: Colour):
         self.end = end
@@ -80,17 +88,60 @@ class Cell:
         return [Colour.GRAY, Colour.YELLOW, Colour.GREEN][index]
 
     def get_char(img_array: np.ndarray) -> str:
-        img_array[np.all(img_array < GameColours.GRAY, axis=-1)] = GameColours.WHITE
-        img_array[~np.all(img_array == GameColours.WHITE, axis=-1)] = GameColours.BLACK
-        data = pytesseract.image_to_string(
-            Image.fromarray(img_array), config="--psm 10 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        )
+        data = pytesseract.image_to_string(Image.fromarray(_binarize(img_array)), config=f"--psm 10 {_TESSERACT_LETTERS}")
         data = data.replace("\n", "")
 
         if len(data) != 1:
             raise Exception("Could not parse cell character")
         return data
 
+    # reads the characters of all cells, first by matching them against the glyph templates of the game font
+    # the cells that do not match a template clearly enough are read with tesseract
+    # the characters read with tesseract are cached by their binarized cells, so each glyph only reaches tesseract once
+    def get_chars(img_arrays: list[np.ndarray]) -> list[str]:
+        glyphs = _glyph_binaries(img_arrays)
+        cache = glyph_cache()
+        chars = [cache.get(glyph) for glyph in glyphs]
+
+        if None in chars:
+            classified = glyph_classifier.templates().classify(glyphs)
+            chars = [char or (match if margin >= glyph_classifier.MIN_MARGIN else None) for char, (match, margin) in zip(chars, classified)]
+
+        unknown = [i for i, char in enumerate(chars) if char is None]
+        if unknown:
+            read = Cell.read_chars([img_arrays[i] for i in unknown], [_binarize(img_arrays[i]) for i in unknown])
+            for i, char in zip(unknown, read):
+                chars[i] = char
+                cache.put(glyphs[i], char)
+        return chars
+
+    # reads the characters of the cells with a single tesseract call on a montage of their binarized images
+    # cells without exactly one character in the montage are read on their own
+    def read_chars(img_arrays: list[np.ndarray], binaries: list[np.ndarray]) -> list[str]:
+        height = max(binary.shape[0] for binary in binaries)
+        width = max(binary.shape[1] for binary in binaries)
+        gap = width // 2
+
+        # the cells side by side in one line, centred in tiles of the same size and separated by black gaps
+        montage = np.zeros((height + 2 * gap, gap + len(binaries) * (width + gap)), dtype=np.uint8)
+        for i, binary in enumerate(binaries):
+            y = gap + (height - binary.shape[0]) // 2
+            x = gap + i * (width + gap) + (width - binary.shape[1]) // 2
+            montage[y : y + binary.shape[0], x : x + binary.shape[1]] = binary
+
+        # each line of the boxes is "<char> <left> <bottom> <right> <top> <page>"
+        boxes = pytesseract.image_to_boxes(Image.fromarray(montage), config=f"--psm 7 {_TESSERACT_LETTERS}")
+        found = [[] for _ in binaries]
+        for line in boxes.splitlines():
+            fields = line.split()
+            if len(fields) < 5 or len(fields[0]) != 1 or not "A" <= fields[0] <= "Z":
+                continue
+            tile = ((int(fields[1]) + int(fields[3])) // 2 - gap // 2) // (width + gap)
+            if 0 <= tile < len(found):
+                found[tile].append(fields[0])
+
+        return [chars[0] if len(chars) == 1 else Cell.get_char(img_array) for chars, img_array in zip(found, img_arrays)]
+
 
 class Gridle:
     def __init__(self, cells: list[Cell]):
@@ -101,12 +152,11 @@ class Gridle:
             image = image.convert("RGB")
 
         img = _GridleImage(image)
-        start = img.find_first_cell()
-        cells = img.parse_row(start, 5)
-        for count in (3, 5, 3, 5):
-            start = img.next_vertical(start)
-            cells.extend(img.parse_row(start, count))
-        return Gridle(cells)
+        boxes = img.cached_cells()
+        crops = [img.crop(start, end) for start, end in boxes]
+        colours = [Cell.get_colour(crop) for crop in crops]
+        chars = Cell.get_chars(crops)
+        return Gridle([Cell(start, end, char, colour) for (start, end), char, colour in zip(boxes, chars, colours)])
 
     def chars(self) -> list[str]:
         return [cell.char for cell in self.cells]
@@ -165,35 +215,102 @@ class _GridleImage:
 
         return (first_x, first_y)
 
-    def parse_row(self, start, length):
-        row = []
-        for i in range(length):
-            end = self.extract_cell(start)
-            row.append(Cell.parse(self.img_array, start, end))
-            if i + 1 < length:
-                start = self.next_horizontal(start)
-        return row
+    # returns the (start, end) corners of all cells row by row
+    # the rows and columns of the grid are the first five runs of the row and column profiles of the pixels
+    # that are not background in the grid region, which starts at the first cell
+    # the grid is centred and square, so the region ends as far from the first cell as the first cell is from the left edge
+    # the region grows to the bottom of the image if five rows do not fit into it
+    def find_cells(self):
+        first_x, first_y = self.find_first_cell()
+        size = self.img_array.shape[1] - 2 * first_x
+        cells = ~_is_colour(self.img_array[first_y : first_y + size, first_x : first_x + size], GameColours.BACKGROUND)
+        if _count_runs(cells.any(axis=1)) < 5:
+            cells = ~_is_colour(self.img_array[first_y:, first_x : first_x + size], GameColours.BACKGROUND)
+
+        row_starts, row_ends = _runs(cells.any(axis=1), 5)
+        col_starts, col_ends = _runs(cells[: row_ends[-1] + 1].any(axis=0), 5)
+
+        boxes = []
+        for row in range(5):
+            for col in range(0, 5, 1 if row % 2 == 0 else 2):
+                start = (int(first_x + col_starts[col]), int(first_y + row_starts[row]))
+                end = (int(first_x + col_ends[col]), int(first_y + row_ends[row]))
+                boxes.append((start, end))
+        return boxes
+
+    # returns the boxes of the cells like 'find_cells', but takes them from the layout cache if they still fit the screenshot
+    def cached_cells(self):
+        height, width = self.img_array.shape[:2]
+        cache = layout_cache()
+        boxes = cache.get(width, height)
+        if boxes is None or not self.fits(boxes):
+            boxes = self.find_cells()
+            cache.put(width, height, boxes)
+        return boxes
+
+    # checks that 'boxes' are at the cells of the screenshot: the middle of each edge of a box has to be
+    # a pixel of the cell and the pixel next to it on the outside has to be background
+    def fits(self, boxes):
+        boxes = np.array(boxes)
+        (start_x, start_y), (end_x, end_y) = boxes[:, 0].T, boxes[:, 1].T
+        centre_x, centre_y = (start_x + end_x) // 2, (start_y + end_y) // 2
+        inside = (np.concatenate([start_y, end_y, centre_y, centre_y]), np.concatenate([centre_x, centre_x, start_x, end_x]))
+        outside = (
+            np.concatenate([start_y - 1, end_y + 1, centre_y, centre_y]),
+            np.concatenate([centre_x, centre_x, start_x - 1, end_x + 1]),
+        )
 
-    def extract_cell(self, start):
-        start_x, start_y = start
-        end_x = start_x + _next_background(self.img_array[start_y, start_x:]) - 1
-        end_y = start_y + _next_background(self.img_array[start_y:, end_x]) - 1
+        height, width = self.img_array.shape[:2]
+        if outside[0].min() < 0 or outside[1].min() < 0 or outside[0].max() >= height or outside[1].max() >= width:
+            return False
+        background = GameColours.BACKGROUND
+        return not _is_colour(self.img_array[inside], background).any() and _is_colour(self.img_array[outside], background).all()
 
-        return (end_x, end_y)
+    def crop(self, start, end):
+        return self.img_array[start[1] : end[1], start[0] : end[0]]
 
-    def next_horizontal(self, start):
-        start_x, start_y = start
-        next_back = start_x + _next_background(self.img_array[start_y, start_x:])
-        next_black = next_back + _next_black(self.img_array[start_y, next_back:])
 
-        return (next_black, start_y)
+# returns the number of runs of set flags in 'profile'
+def _count_runs(profile):
+    return len(_edges(profile)) // 2
+
+
+# returns the first and last index of each of the first 'count' runs of set flags in 'profile'
+def _runs(profile, count):
+    edges = _edges(profile)
+    starts, ends = edges[0::2], edges[1::2] - 1
+    if len(starts) < count:
+        raise Exception("Could not find the cells")
+    return starts[:count], ends[:count]
+
+
+# returns the indices at which runs of set flags in 'profile' start and the indices after they end
+def _edges(profile):
+    return np.flatnonzero(np.diff(profile.astype(np.int8), prepend=0, append=0))
+
+
+# returns whether each pixel of 'img_array' has 'colour', comparing channel by channel
+def _is_colour(img_array, colour):
+    red, green, blue = colour
+    return (img_array[..., 0] == red) & (img_array[..., 1] == green) & (img_array[..., 2] == blue)
+
+
+# the cell as white character on black, dark pixels become white and the tile colours black
+def _binarize(img_array):
+    red, green, blue = img_array[..., 0], img_array[..., 1], img_array[..., 2]
+    dark = (red < GameColours.GRAY[0]) & (green < GameColours.GRAY[1]) & (blue < GameColours.GRAY[2])
+    white = (red == GameColours.WHITE[0]) & (green == GameColours.WHITE[1]) & (blue == GameColours.WHITE[2])
+    return np.where(dark | white, np.uint8(255), np.uint8(0))
 
-    def next_vertical(self, start):
-        start_x, start_y = start
-        next_back = start_y + _next_background(self.img_array[start_y:, start_x])
-        next_black = next_back + _next_black(self.img_array[next_back:, start_x])
 
-        return (start_x, next_black)
+# the binarized cells sampled down to about _GLYPH_HEIGHT pixels in height as an (N, height, width) array,
+# as they are matched against the glyph templates
+def _glyph_binaries(img_arrays):
+    step = max(1, min(img_array.shape[0] for img_array in img_arrays) // _GLYPH_HEIGHT)
+    sampled = [img_array[::step, ::step] for img_array in img_arrays]
+    height = min(img_array.shape[0] for img_array in sampled)
+    width = min(img_array.shape[1] for img_array in sampled)
+    return _binarize(np.stack([img_array[:height, :width] for img_array in sampled]))
 
 
 def _next_matching(condition):
@@ -1,6 +1,13 @@
-import re
-from typing import Optional
+import math
+import time
+import itertools
+import multiprocessing
+from typing import Callable, Iterable, Iterator, Optional, Self
 from abc import ABC, abstractmethod
+from collections import deque
+import numpy as np
+from corpus_index import CorpusIndex, WordPattern, letter_counts
+from shared_corpus import SharedCorpus
 from gridle_parser import Cell, Colour, Gridle
 
 
@@ -57,8 +64,40 @@ class Column(WordSelector):
         return self.gridle.get_row(other)
 
 
+# timings and candidate counts collected while solving a gridle
+class SolverStats:
+    def __init__(self):
+        # seconds spent in each phase, not counting the time of phases nested in it
+        self.phase_times: dict[str, float] = {}
+        # number of intersections taken from the propagation queue
+        self.revisions = 0
+        # candidate counts of the rows and columns after each revision
+        self.candidate_counts: list[tuple[int, ...]] = []
+        self._nested: list[float] = []
+
+    # wraps 'function' so that its run time is added to 'phase'
+    def timed(self, phase: str, function: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            self._nested.append(0.0)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = self._nested.pop()
+                self.phase_times[phase] = self.phase_times.get(phase, 0.0) + elapsed - nested
+                if self._nested:
+                    self._nested[-1] += elapsed
+
+        return wrapper
+
+    def total_time(self) -> float:
+        return sum(self.phase_times.values())
+
+
 class GridleSolution(Gridle):
-    def __init__(self, gridle: Gridle, solution: list[list[Optional[str]]]):
+    def __init__(self, gridle: Gridle, solution: list[list[Optional[str]]], stats: Optional[SolverStats] = None):
+        self.stats = stats
         cells = []
         for row_g, row_s in zip(gridle.to_grid(), solution):
             for cell, char in zip(row_g, row_s):
@@ -71,8 +110,8 @@ class GridleSolution(Gridle):
         return len(self.cells) == 21
 
 
-# returns all words of the 'corpus' that satisfy the requirements of the word selected by 'selector' from 'gridle'
-def possible_words(gridle: Gridle, corpus: list[str], selector: WordSelector) -> list[str]:
+# returns the pattern the word selected by 'selector' from 'gridle' has to match
+def word_pattern(gridle: Gridle, selector: WordSelector) -> WordPattern:
     cells = selector.cells()
 
     rows = selector.rows()
@@ -88,11 +127,11 @@ def possible_words(gridle: Gridle, corpus: list[str], selector: WordSelector) ->
     # list of gray chars that do not also occurr as yellow in this word
     disallowed = set(filter(Cell.is_gray, cells)) - yellows
 
-    # build a regex pattern which candidates have to match
-    pattern = ""
+    # collect the chars each position of a candidate may have
+    allowed = []
     for i, cell in enumerate(cells):
         if cell.is_green():
-            pattern += str(cell)
+            allowed.append(frozenset({cell.char}))
         else:
             # match for any available gray char and yellows of the same word
             available = available_non_intersect.union(filter(Cell.is_yellow, cells))
@@ -104,107 +143,336 @@ def possible_words(gridle: Gridle, corpus: list[str], selector: WordSelector) ->
                 # also allow yellows of intersecting rows/columns
                 available = available.union(filter(Cell.is_yellow, selector.other_axis(i // 2)))
 
-            available = "".join(map(str, available))  # stringify all cells
-            pattern += f"[{available}]"
+            allowed.append(frozenset(map(str, available)))  # stringify all cells
 
-    p = re.compile(pattern)
-    regex_filtered_words = list(filter(p.match, corpus))
+    # yellow chars that need to be in the word at non-green positions
+    definite_yellows = frozenset(map(str, filter(Cell.is_yellow, [cells[1], cells[3]])))
+    free = tuple(i for i, cell in enumerate(cells) if not cell.is_green())
 
-    # yellow chars that need to be in the word
-    definite_yellows = set(filter(Cell.is_yellow, [cells[1], cells[3]]))
+    return WordPattern(tuple(allowed), definite_yellows, free)
 
-    # look for words that contain all the given yellow chars at non-green positions
-    possible_words = []
-    for word in regex_filtered_words:
-        # the same word but green chars removed
-        word_without_greens = list(word)
-        for cell in cells:
-            if cell.is_green():
-                word_without_greens.remove(cell.char)
 
-        for c in definite_yellows:
-            if c.char not in word_without_greens:
-                break
-        else:
-            possible_words.append(word)
-
-    return possible_words
-
-
-def solve_gridle(gridle: Gridle, corpus: list[str]) -> GridleSolution:
-    result = [[None] * 5, [None] * 5, [None] * 5, [None] * 5, [None] * 5]
-    char_bag = gridle.chars()
-    row_possibilities = []
-    col_possibilities = []
-    for rc in range(3):
-        row_possibilities.append(possible_words(gridle, corpus, Row(gridle, rc)))
-        col_possibilities.append(possible_words(gridle, corpus, Column(gridle, rc)))
-
-    changed = True
-    while changed:
-        changed = False
-
-        # remove candidates that conflict with known characters:
-        for i in range(3):
-            for j in range(5):
-                if result[i * 2][j] is not None:
-                    row_possibilities[i] = [p for p in row_possibilities[i] if p[j] == result[i * 2][j]]
-                if result[j][i * 2] is not None:
-                    col_possibilities[i] = [p for p in col_possibilities[i] if p[j] == result[j][i * 2]]
-
-        # remove candidates that would use unavailable characters:
-        for possibilities in (row_possibilities, col_possibilities):
-            for possibility in possibilities:  # for column or row
-                for candidate in possibility.copy():
-                    char_bag_copy = char_bag.copy()
-                    for char in candidate:
-                        if char in char_bag_copy:
-                            char_bag_copy.remove(char)
-                        else:
-                            possibility.remove(candidate)
-                            changed = True
-                            break
-
-        # remove candidates that use a character which no intersecting candidate uses at this position:
-        for r, row in enumerate(row_possibilities):
-            for candidate in row.copy():
-                for c, col in enumerate(col_possibilities):
-                    # if there are intersecting candidates but none of them contain the char at the required position:
-                    if col and candidate[c * 2] not in [word[r * 2] for word in col]:
-                        row.remove(candidate)
-                        changed = True
-                        break
-        for c, col in enumerate(col_possibilities):
-            for candidate in col.copy():
-                for r, row in enumerate(row_possibilities):
-                    # if there are intersecting candidates but none of them contain the char at the required position:
-                    if row and candidate[r * 2] not in [word[c * 2] for word in row]:
-                        col.remove(candidate)
-                        changed = True
-                        break
-
-        # fill in words if there is only one possibility:
-        for rc in range(3):
-            match row_possibilities[rc]:
-                case [word]:
-                    changed = True
-                    for i, char in enumerate(word):
-                        assert result[rc * 2][i] in (None, char)
-                        # if it is the first character on a non-intersection or the second on an intersection tile
-                        if i % 2 != 0 or not col_possibilities[i // 2]:
-                            char_bag.remove(char)  # remove first occurrence
-                        result[rc * 2][i] = char
-                    row_possibilities[rc].clear()
-
-            match col_possibilities[rc]:
-                case [word]:
-                    changed = True
-                    for i, char in enumerate(word):
-                        assert result[i][rc * 2] in (None, char)
-                        # if it is the first character on a non-intersection or the second on an intersection tile
-                        if i % 2 != 0 or not row_possibilities[i // 2]:
-                            char_bag.remove(char)  # remove first occurrence
-                        result[i][rc * 2] = char
-                    col_possibilities[rc].clear()
-
-    return GridleSolution(gridle, result)
+# returns all words of the 'corpus' that satisfy the requirements of the word selected by 'selector' from 'gridle'
+# 'backend' selects how the corpus is searched: "bitset", "numpy" or "trie"
+# the words are cached by the pattern of the word, so boards with the same pattern share them
+def possible_words(gridle: Gridle, corpus: list[str], selector: WordSelector, backend: str = "bitset") -> list[str]:
+    return CorpusIndex.of(corpus).match_cached(word_pattern(gridle, selector), backend)
+
+
+# 'time_budget' is the number of seconds after which a search for an ambiguous gridle is given up
+# if 'stats' is set, the solution carries the SolverStats of this run
+def solve_gridle(
+    gridle: Gridle, corpus: list[str], backend: str = "bitset", time_budget: float = 1.0, stats: bool = False
+) -> GridleSolution:
+    deadline = time.monotonic() + time_budget
+    solver_stats = SolverStats() if stats else None
+    propagation = _propagate(gridle, corpus, backend, solver_stats)
+    result = propagation.result
+
+    # propagation got stuck, so search the remaining candidates of the words that are still open
+    if propagation.consistent and not all(propagation.fixed):
+        # the search tries frequent words first, but with word frequencies it compares more boards to find the most likely one
+        count = _RANKED_SOLUTIONS if propagation.index.weighted else 1
+        search = _most_likely if solver_stats is None else solver_stats.timed("search", _most_likely)
+        result = search(_solutions(propagation, deadline), count) or result
+
+    return GridleSolution(gridle, result, solver_stats)
+
+
+# yields every solution of 'gridle', at most 'limit' of them
+# raises TimeoutError if the solutions are not enumerated within 'time_budget' seconds
+def solve_all(
+    gridle: Gridle, corpus: list[str], limit: Optional[int] = None, backend: str = "bitset", time_budget: Optional[float] = None
+) -> Iterator[GridleSolution]:
+    deadline = math.inf if time_budget is None else time.monotonic() + time_budget
+    propagation = _propagate(gridle, corpus, backend)
+    if not propagation.consistent:
+        return
+
+    for result, _ in itertools.islice(_solutions(propagation, deadline), limit):
+        yield GridleSolution(gridle, result)
+
+
+# returns the number of solutions of 'gridle', counting stops at 'limit'
+def count_solutions(
+    gridle: Gridle, corpus: list[str], limit: Optional[int] = None, backend: str = "bitset", time_budget: Optional[float] = None
+) -> int:
+    return sum(1 for _ in solve_all(gridle, corpus, limit, backend, time_budget))
+
+
+# solves 'gridles' on 'workers' processes and yields (position in 'gridles', solution) pairs
+# the solutions come in input order if 'ordered' is set and as soon as they are solved otherwise
+def solve_many(
+    gridles: Iterable[Gridle],
+    corpus: list[str],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    backend: str = "bitset",
+    time_budget: float = 1.0,
+    chunksize: int = 16,
+) -> Iterator[tuple[int, GridleSolution]]:
+    # the workers attach to one shared copy of the corpus and its index instead of building their own
+    shared = SharedCorpus.publish(corpus)
+    try:
+        with multiprocessing.Pool(workers, _init_worker, (shared, backend, time_budget)) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            yield from imap(_solve_numbered, enumerate(gridles), chunksize)
+    finally:
+        shared.unlink()
+
+
+_worker_args = None
+
+
+# attaches the worker process to the shared corpus index
+def _init_worker(corpus: SharedCorpus, backend: str, time_budget: float):
+    global _worker_args
+    corpus.index()
+    _worker_args = (corpus, backend, time_budget)
+
+
+def _solve_numbered(numbered: tuple[int, Gridle]) -> tuple[int, GridleSolution]:
+    i, gridle = numbered
+    return i, solve_gridle(gridle, *_worker_args)
+
+
+def _row_slots(row: int) -> list[tuple[int, int]]:
+    return [(row * 2, i) for i in range(5)]
+
+
+def _col_slots(col: int) -> list[tuple[int, int]]:
+    return [(i, col * 2) for i in range(5)]
+
+
+# the grid coordinates of the rows followed by the columns
+_SLOTS = [_row_slots(rc) for rc in range(3)] + [_col_slots(rc) for rc in range(3)]
+
+
+# returns the word and position that cross 'position' of 'word' (rows are 0-2, columns 3-5)
+def _crossing(word: int, position: int) -> tuple[int, int]:
+    if word < 3:
+        return 3 + position // 2, word * 2
+    return position // 2, (word - 3) * 2
+
+
+class _Contradiction(Exception):
+    pass
+
+
+# arc consistency between the words of a gridle, driven by a queue of intersections whose support changed
+class _Propagation:
+    def __init__(self, index: CorpusIndex, candidates: list[np.ndarray], chars: list[str], stats: Optional[SolverStats] = None):
+        self.index = index
+        self.candidates = candidates
+        self.codes = [index.array[ids] - ord("A") for ids in candidates]
+        self.counts = [index.counts[ids] for ids in candidates]
+        self.alive = [np.ones(len(ids), dtype=bool) for ids in candidates]
+        self.fixed = [False] * 6
+        self.consistent = True
+        self.result = [[None] * 5, [None] * 5, [None] * 5, [None] * 5, [None] * 5]
+
+        # number of each character A-Z that is not placed in 'result' yet
+        self.bag = letter_counts(chars)
+
+        # support[word][position][letter] is the number of alive candidates of 'word' with 'letter' at the intersection 'position'
+        self.support = [{p: np.bincount(codes[:, p], minlength=26) for p in (0, 2, 4)} for codes in self.codes]
+
+        # intersections (word, position) at which 'word' has to be checked against its crossing word
+        self.queue = deque()
+        self.queued = set()
+
+        # only time the phases if asked to, so that there is no overhead otherwise
+        self.stats = stats
+        if stats is not None:
+            self.revise = stats.timed("intersection", self.revise)
+            self.revise_bag = stats.timed("bag", self.revise_bag)
+            self.fix = stats.timed("fill-in", self.fix)
+
+    # the alive candidates of 'word'
+    def words(self, word: int) -> list[str]:
+        return [self.index.corpus[i] for i in self.candidates[word][self.alive[word]]]
+
+    # propagates until nothing changes, returns False if some word has no candidates left
+    def run(self) -> bool:
+        try:
+            for word in range(6):
+                for position in (0, 2, 4):
+                    self.push(word, position)
+                self.check(word)
+                self.revise_bag(word)
+            self.settle()
+        except _Contradiction:
+            self.consistent = False
+        return self.consistent
+
+    # revises the queued intersections until the queue is empty
+    def settle(self):
+        while self.queue:
+            arc = self.queue.popleft()
+            self.queued.discard(arc)
+            self.revise(*arc)
+            if self.stats is not None:
+                self.stats.revisions += 1
+                self.stats.candidate_counts.append(tuple(map(np.count_nonzero, self.alive)))
+
+    # returns a copy of the state of this propagation for a search node, the candidates are shared and it is not timed
+    def copy(self) -> Self:
+        state = _Propagation.__new__(_Propagation)
+        state.index, state.candidates, state.codes, state.counts = self.index, self.candidates, self.codes, self.counts
+        state.alive = [alive.copy() for alive in self.alive]
+        state.support = [{position: support.copy() for position, support in supports.items()} for supports in self.support]
+        state.fixed = self.fixed.copy()
+        state.consistent = self.consistent
+        state.result = [row.copy() for row in self.result]
+        state.bag = self.bag
+        state.queue = deque()
+        state.queued = set()
+        state.stats = None
+        return state
+
+    # keeps only the 'i'th candidate of 'word' and propagates, returns False if some word has no candidates left
+    def assign(self, word: int, i: int) -> bool:
+        drop = self.alive[word].copy()
+        drop[i] = False
+        try:
+            self.remove(word, drop)
+            self.settle()
+        except _Contradiction:
+            self.consistent = False
+        return self.consistent
+
+    def push(self, word: int, position: int):
+        if (word, position) not in self.queued:
+            self.queued.add((word, position))
+            self.queue.append((word, position))
+
+    # removes the candidates of 'word' whose character at 'position' no candidate of the crossing word has
+    def revise(self, word: int, position: int):
+        other, other_position = _crossing(word, position)
+        supported = self.support[other][other_position] > 0
+        self.remove(word, self.alive[word] & ~supported[self.codes[word][:, position]])
+
+    # removes the candidates of 'word' that would use unavailable characters
+    def revise_bag(self, word: int):
+        if self.fixed[word]:
+            return
+        # characters already placed in this word can be reused by its candidates
+        placed = [self.result[y][x] for y, x in _SLOTS[word] if self.result[y][x] is not None]
+        available = self.bag + letter_counts(placed)
+        self.remove(word, self.alive[word] & ~(self.counts[word] <= available).all(axis=1))
+
+    def remove(self, word: int, drop: np.ndarray):
+        if not drop.any():
+            return
+        self.alive[word] &= ~drop
+
+        # only the crossing words whose characters lost their last support need to be revised
+        for position, support in self.support[word].items():
+            lost = np.bincount(self.codes[word][drop, position], minlength=26)
+            support -= lost
+            if (support[lost > 0] == 0).any():
+                self.push(*_crossing(word, position))
+
+        self.check(word)
+
+    # fixes 'word' if only one candidate is left
+    def check(self, word: int):
+        match np.count_nonzero(self.alive[word]):
+            case 0:
+                raise _Contradiction()
+            case 1 if not self.fixed[word]:
+                self.fix(word)
+
+    def fix(self, word: int):
+        self.fixed[word] = True
+        placed = []
+        for (y, x), char in zip(_SLOTS[word], self.words(word)[0]):
+            # a crossing word was fixed with another character before this intersection got revised
+            if self.result[y][x] not in (None, char):
+                raise _Contradiction()
+            if self.result[y][x] is None:
+                placed.append(char)
+                self.result[y][x] = char
+        self.bag = self.bag - letter_counts(placed)
+
+        for other in range(6):
+            self.revise_bag(other)
+
+
+class _OutOfTime(TimeoutError):
+    pass
+
+
+# runs the propagation on the candidates of all words of 'gridle'
+def _propagate(gridle: Gridle, corpus: list[str], backend: str, stats: Optional[SolverStats] = None) -> _Propagation:
+    bag = letter_counts(gridle.chars())
+
+    # only words that can be formed from the letters of the gridle can be part of its solution
+    # the trie checks the letters while it walks, the other backends filter the cached matches of the pattern
+    index = CorpusIndex.of(corpus)
+    formable = None if backend == "trie" else index.formable_ids(bag)
+
+    def find_candidates(selector: WordSelector) -> np.ndarray:
+        pattern = word_pattern(gridle, selector)
+        if formable is None:
+            return index.match_trie(pattern, bag)
+        # the matches of a pattern are cached for the whole corpus, so boards with the same pattern share them
+        return np.intersect1d(index.match_ids_cached(pattern, backend), formable, assume_unique=True)
+
+    if stats is not None:
+        find_candidates = stats.timed("candidates", find_candidates)
+
+    # candidates of the rows followed by the columns as arrays of indices into the corpus
+    selectors = [Row(gridle, rc) for rc in range(3)] + [Column(gridle, rc) for rc in range(3)]
+    candidates = [find_candidates(selector) for selector in selectors]
+    if index.weighted:
+        # a search tries the candidates in this order, so sort them by descending frequency
+        candidates = [ids[np.argsort(-index.weights[ids], kind="stable")] for ids in candidates]
+
+    propagation = _Propagation(index, candidates, gridle.chars(), stats)
+    propagation.run()
+    return propagation
+
+
+# the number of solutions compared to find the most likely one if the corpus has word frequencies
+_RANKED_SOLUTIONS = 32
+
+
+# returns the grid with the highest score of the first 'count' solutions or None if there is none
+# if the time runs out, the best solution found so far is returned
+def _most_likely(solutions: Iterator[tuple[list[list[str]], float]], count: int) -> Optional[list[list[str]]]:
+    best = None
+    try:
+        for grid, score in itertools.islice(solutions, count):
+            if best is None or score > best[1]:
+                best = (grid, score)
+    except _OutOfTime:
+        pass
+    return None if best is None else best[0]
+
+
+# yields the grids of all solutions that can be reached from the state of 'propagation' with their scores
+# the score is the sum of the logarithmic frequencies of the words
+def _solutions(propagation: _Propagation, deadline: float) -> Iterator[tuple[list[list[str]], float]]:
+    yield from _search(propagation, deadline)
+
+
+# fixes the open words of 'state' one candidate at a time and yields a copy of every complete grid with its score
+# every choice is propagated like the candidates of the gridle were, so each node sees the same bag and intersection rules
+def _search(state: _Propagation, deadline: float) -> Iterator[tuple[list[list[str]], float]]:
+    if time.monotonic() > deadline:
+        raise _OutOfTime()
+
+    open_words = [word for word in range(6) if not state.fixed[word]]
+    if not open_words:
+        weights = state.index.weights
+        score = sum(float(np.log1p(weights[ids[alive]]).sum()) for ids, alive in zip(state.candidates, state.alive))
+        yield [row.copy() for row in state.result], score
+        return
+
+    # branch on the open word with the fewest candidates
+    word = min(open_words, key=lambda w: np.count_nonzero(state.alive[w]))
+    for i in np.flatnonzero(state.alive[word]):
+        child = state.copy()
+        if child.assign(word, i):
+            yield from _search(child, deadline)
@@ -0,0 +1,42 @@
+import os
+import json
+from functools import cache
+from typing import Optional
+from cache import DiskCache, LRUCache, cache_dir
+
+# the (start, end) corners of the cells of a board
+Boxes = list[tuple[tuple[int, int], tuple[int, int]]]
+
+
+# caches the cell boxes of the boards by screen size in memory and in an SQLite file in 'directory'
+# the board is at the same place on every screenshot of a device, so it only has to be detected once per screen size
+# and orientation; callers check that the cached boxes still fit a screenshot before they use them
+class LayoutCache:
+    def __init__(self, directory: Optional[str] = None, memory_entries: int = 16, disk_entries: int = 256):
+        self.memory = LRUCache(memory_entries)
+        self.disk = DiskCache(os.path.join(directory or cache_dir(), "layouts.sqlite"), disk_entries)
+
+    # returns the boxes of screenshots of 'width' x 'height' pixels if they were stored before
+    def get(self, width: int, height: int) -> Optional[Boxes]:
+        key = f"{width}x{height}"
+        boxes = self.memory.get(key)
+        if boxes is None:
+            stored = self.disk.get(key)
+            if stored is not None:
+                boxes = [(tuple(start), tuple(end)) for start, end in json.loads(stored)]
+                self.memory.put(key, boxes)
+        return boxes
+
+    def put(self, width: int, height: int, boxes: Boxes):
+        key = f"{width}x{height}"
+        self.memory.put(key, boxes)
+        self.disk.put(key, json.dumps(boxes).encode())
+
+    def close(self):
+        self.disk.close()
+
+
+# returns the layout cache in the default cache directory, it is opened on first use
+@cache
+def layout_cache() -> LayoutCache:
+    return LayoutCache()
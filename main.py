@@ -1,4 +1,7 @@
-from corpora import CORPUS_EN
+import os
+import sys
+import corpora
+from corpus_index import CorpusIndex
 from gridle_solver import solve_gridle
 from gridle_parser import Gridle
 from swap_solver import calculate_swaps
@@ -6,12 +9,20 @@ from game_controller import capture_screen, execute_swaps
 
 
 def main():
+    # the corpus is either the name of a registered corpus or the path of a word list
+    name = sys.argv[1] if len(sys.argv) > 1 else "en"
+    if name not in corpora.names() and os.path.isfile(name):
+        corpora.register_file(name, name)
+    corpus = corpora.get(name)
+    # derived indexes of the corpus are loaded from a snapshot instead of being rebuilt on every run
+    CorpusIndex.warm(corpus)
+
     image = capture_screen()
 
     gridle = Gridle.parse(image)
     gridle.print()
 
-    solution = solve_gridle(gridle, CORPUS_EN)
+    solution = solve_gridle(gridle, corpus)
     if not solution.is_valid():
         print("Could not solve.")
         exit(1)
@@ -0,0 +1,99 @@
+import numpy as np
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+from typing import Self
+from corpus_index import WORD_LENGTH, Anagrams, CorpusIndex
+
+
+# corpus whose words and index arrays live in one shared memory block
+# it is pickled by the name of the block, so worker processes attach to it without copying
+class SharedCorpus(Sequence):
+    def __init__(self, name: str, count: int, weighted: bool, digest: str, anagram_sizes: tuple[int, int]):
+        self.name = name
+        self.count = count
+        self.digest = digest
+        self.anagram_sizes = anagram_sizes
+        self.shm = shared_memory.SharedMemory(name)
+
+        # block layout: weights (N,) if weighted, the anagram tree, ascii codes (N, 5), letter counts (N, 26) and bitsets
+        # (5, 26, N/8 bytes), these are exactly the parts the solver reads, the index of the corpus takes them from here
+        layout = _layout(count, weighted, anagram_sizes)
+        self.anagrams = Anagrams(self._view(layout["children"]), self._view(layout["order"]), self._view(layout["starts"]))
+        self.array = self._view(layout["array"])
+        self.counts = self._view(layout["counts"])
+        self.packed_bitsets = self._view(layout["bitsets"])
+        self.weights = self._view(layout["weights"]) if weighted else None
+
+    # copies 'corpus' and the arrays of its index to a new shared memory block
+    # the block has to be released with 'unlink' once all processes are done with it
+    def publish(corpus: Sequence[str]) -> Self:
+        index = CorpusIndex.of(corpus)
+        anagram_sizes = (len(index.anagrams.children), len(index.anagrams.starts))
+        layout = _layout(len(corpus), index.weighted, anagram_sizes)
+        size = max(offset + np.dtype(dtype).itemsize * int(np.prod(shape)) for offset, dtype, shape in layout.values())
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        shared = SharedCorpus(shm.name, len(corpus), index.weighted, index.digest, anagram_sizes)
+        shm.close()
+
+        for part, array in zip(shared.anagrams, index.anagrams):
+            part[:] = array
+        shared.array[:] = index.array
+        shared.counts[:] = index.counts
+        for position in range(WORD_LENGTH):
+            for letter in range(26):
+                shared.packed_bitsets[position, letter] = np.packbits(index.columns[position] == ord("A") + letter, bitorder="little")
+        if index.weighted:
+            shared.weights[:] = index.weights
+        return shared
+
+    def __reduce__(self):
+        return SharedCorpus, (self.name, self.count, self.weights is not None, self.digest, self.anagram_sizes)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        return self.array[i].tobytes().decode("ascii")
+
+    # returns the index of this corpus, its arrays are the shared ones
+    def index(self) -> CorpusIndex:
+        return CorpusIndex.of(self)
+
+    # detaches this process from the block
+    def close(self):
+        CorpusIndex.forget(self)
+        self.anagrams = self.array = self.counts = self.packed_bitsets = self.weights = None
+        self.shm.close()
+
+    # detaches and frees the block, other processes must not use it afterwards
+    def unlink(self):
+        self.close()
+        self.shm.unlink()
+
+    def _view(self, part: tuple[int, str, tuple[int, ...]]) -> np.ndarray:
+        offset, dtype, shape = part
+        return np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset)
+
+
+# returns the offset, dtype and shape of every array in a block of 'count' words, wider types come first to stay aligned
+# 'anagram_sizes' are the number of nodes of the anagram tree and the length of its multiset starts
+def _layout(count: int, weighted: bool, anagram_sizes: tuple[int, int]) -> dict[str, tuple[int, str, tuple[int, ...]]]:
+    layout = {}
+    offset = 0
+    nodes, starts = anagram_sizes
+    parts = [
+        ("children", "i4", (nodes, 26)),
+        ("order", "i4", (count,)),
+        ("starts", "i4", (starts,)),
+        ("array", "u1", (count, WORD_LENGTH)),
+        ("counts", "u1", (count, 26)),
+        ("bitsets", "u1", (WORD_LENGTH, 26, (count + 7) // 8)),
+    ]
+    if weighted:
+        parts.insert(0, ("weights", "f8", (count,)))
+    for name, dtype, shape in parts:
+        layout[name] = (offset, dtype, shape)
+        offset += np.dtype(dtype).itemsize * int(np.prod(shape))
+    return layout
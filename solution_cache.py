@@ -0,0 +1,52 @@
+import os
+import hashlib
+from typing import Optional
+from cache import DiskCache, LRUCache, cache_dir
+from corpus_index import CorpusIndex
+from gridle_parser import Gridle
+from gridle_solver import GridleSolution, solve_gridle
+
+
+# returns a canonical hash of the characters and colours of all cells of 'gridle'
+def fingerprint(gridle: Gridle) -> str:
+    pairs = "".join(f"{cell.char}{cell.colour.name[0]}" for cell in gridle.cells)
+    return hashlib.blake2b(pairs.encode(), digest_size=16).hexdigest()
+
+
+# caches the solutions of 'solve_gridle' for 'corpus' in memory and in an SQLite file in 'directory'
+# each corpus has its own file named by its digest, so caches of different corpora can be used side by side
+class SolutionCache:
+    def __init__(self, corpus: list[str], directory: Optional[str] = None, memory_entries: int = 4096, disk_entries: int = 1_000_000):
+        self.corpus = corpus
+        self.memory = LRUCache(memory_entries)
+        digest = CorpusIndex.of(corpus).digest
+        self.disk = DiskCache(os.path.join(directory or cache_dir(), f"solutions-{digest}.sqlite"), disk_entries)
+
+    # returns the cached solution of 'gridle' or solves it, the arguments are passed on to 'solve_gridle'
+    # only valid solutions are cached since a larger time budget may solve the others
+    def solve(self, gridle: Gridle, **kwargs) -> GridleSolution:
+        key = fingerprint(gridle)
+        chars = self.memory.get(key)
+        if chars is None:
+            stored = self.disk.get(key)
+            if stored is None:
+                solution = solve_gridle(gridle, self.corpus, **kwargs)
+                if not solution.is_valid():
+                    return solution
+                chars = "".join(solution.chars())
+                self.disk.put(key, chars.encode())
+            else:
+                chars = stored.decode()
+            self.memory.put(key, chars)
+
+        return _solution_from_chars(gridle, chars)
+
+    def close(self):
+        self.disk.close()
+
+
+# rebuilds the solution of 'gridle' from the characters of its cells
+def _solution_from_chars(gridle: Gridle, chars: str) -> GridleSolution:
+    remaining = iter(chars)
+    grid = [[None if cell is None else next(remaining) for cell in row] for row in gridle.to_grid()]
+    return GridleSolution(gridle, grid)